@@ -13,6 +13,9 @@ struct Option {
 
     Option(OptionType t, double k, double T, double S)
         : type(t), strike(k), maturity(T), spot(S) {}
+
+    // +1 for calls, -1 for puts; payoff is max(sign * (S_T - K), 0)
+    double sign() const { return type == OptionType::Call ? 1.0 : -1.0; }
 };
 
 }